@@ -1,18 +1,29 @@
 """Google Cloud authentication for GCP HCP CLI."""
 
+import base64
+import configparser
+import contextlib
 import json
 import logging
 import os
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
-from google.auth import default
 from google.auth.credentials import Credentials
-from google.auth.exceptions import RefreshError, DefaultCredentialsError
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials as OAuth2Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
+from google.auth.exceptions import (
+    DefaultCredentialsError,
+    GoogleAuthError,
+    RefreshError,
+)
+
+# The google-auth transport, OAuth2 and oauthlib modules are imported where
+# they are used: together they add hundreds of milliseconds to CLI startup.
 
 from .exceptions import (
     AuthenticationError,
@@ -22,6 +33,30 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        """Parse JSON bytes."""
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize an object to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _json_loads(data: bytes) -> Any:
+        """Parse JSON bytes."""
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize an object to indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+T = TypeVar("T")
+
 # OAuth 2.0 scopes required for GCP HCP API
 REQUIRED_SCOPES = [
     "openid",
@@ -33,6 +68,115 @@ REQUIRED_SCOPES = [
 # Default credentials file path
 DEFAULT_CREDENTIALS_PATH = Path.home() / ".gcphcp" / "credentials.json"
 
+# Refresh cached identity tokens this many seconds before they expire
+TOKEN_EXPIRY_SKEW_SECONDS = 300
+
+# Credentials closer than this to expiry are refreshed before use
+CREDENTIALS_REFRESH_MARGIN = timedelta(seconds=TOKEN_EXPIRY_SKEW_SECONDS)
+
+# Credentials closer than this to expiry are refreshed in the background
+CREDENTIALS_BACKGROUND_REFRESH_MARGIN = timedelta(minutes=10)
+
+# How long the result of is_authenticated() is reused
+AUTH_STATUS_CACHE_SECONDS = 30.0
+
+
+def _decode_jwt_payload(token: str) -> Optional[Dict[str, Any]]:
+    """Decode the payload of a JWT without verifying its signature.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Decoded payload claims, or None if the token is malformed
+    """
+    # JWT tokens have three parts separated by dots
+    parts = token.split(".")
+    if len(parts) < 2:
+        return None
+
+    # Decode the payload (second part), adding padding if needed
+    payload = parts[1]
+    padding = len(payload) % 4
+    if padding:
+        payload += "=" * (4 - padding)
+
+    try:
+        decoded = base64.urlsafe_b64decode(payload)
+        token_data = json.loads(decoded.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+    return token_data if isinstance(token_data, dict) else None
+
+
+def _gcloud_config_dir() -> Path:
+    """Get the gcloud configuration directory.
+
+    Returns:
+        Path of the gcloud configuration directory
+    """
+    if "CLOUDSDK_CONFIG" in os.environ:
+        return Path(os.environ["CLOUDSDK_CONFIG"])
+    if os.name == "nt" and "APPDATA" in os.environ:
+        return Path(os.environ["APPDATA"]) / "gcloud"
+    return Path.home() / ".config" / "gcloud"
+
+
+def _adc_source_available() -> bool:
+    """Check whether an application default credentials source exists.
+
+    google.auth.default() probes the GCE metadata server when nothing else
+    is configured, which takes seconds off GCE, so it is only worth calling
+    when one of the sources it reads is present.
+
+    Returns:
+        True if an ADC source is configured or the host looks like GCE
+    """
+    if os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+        return True
+    if os.environ.get("GCE_METADATA_HOST") or os.environ.get("GCE_METADATA_IP"):
+        return True
+    if (_gcloud_config_dir() / "application_default_credentials.json").exists():
+        return True
+
+    try:
+        product_name = Path("/sys/class/dmi/id/product_name").read_text()
+    except OSError:
+        return False
+    return product_name.strip().startswith("Google")
+
+
+def _read_gcloud_account() -> Optional[str]:
+    """Read the active account from the gcloud configuration files.
+
+    Returns:
+        Active account email, or None if it is not configured
+    """
+    account = os.environ.get("CLOUDSDK_CORE_ACCOUNT")
+    if account:
+        return account
+
+    config_dir = _gcloud_config_dir()
+    config_name = os.environ.get("CLOUDSDK_ACTIVE_CONFIG_NAME")
+    if not config_name:
+        try:
+            config_name = (config_dir / "active_config").read_text().strip()
+        except FileNotFoundError:
+            config_name = "default"
+
+    parser = configparser.ConfigParser()
+    try:
+        with open(config_dir / "configurations" / f"config_{config_name}") as f:
+            parser.read_file(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, configparser.Error) as e:
+        logger.debug(f"Failed to read gcloud configuration: {e}")
+        return None
+
+    return parser.get("core", "account", fallback=None) or None
+
 
 class GoogleCloudAuth:
     """Google Cloud authentication manager for GCP HCP CLI."""
@@ -55,6 +199,50 @@ class GoogleCloudAuth:
         self.audience = audience
         self._credentials: Optional[Credentials] = None
         self._user_email: Optional[str] = None
+        self._cached_id_token: Optional[str] = None
+        self._cached_id_token_exp: float = 0.0
+        self._cached_user_email: Optional[str] = None
+        self._last_decoded_id_token: Optional[str] = None
+        self._last_decoded_email: Optional[str] = None
+        self._is_auth_cache: Optional[Tuple[float, bool]] = None
+        self._adc_unavailable = False
+        self._refresh_lock = threading.Lock()
+        self._refresh_inflight: Dict[str, Future] = {}
+
+    def _run_single_flight(self, key: str, func: Callable[[], T]) -> T:
+        """Run a refresh operation, sharing one in-flight call per key.
+
+        Concurrent callers using the same key wait for the call already in
+        progress and receive its result (or exception) instead of issuing
+        their own.
+
+        Args:
+            key: Identifies the refresh operation
+            func: Function performing the refresh
+
+        Returns:
+            Result of the refresh operation
+        """
+        with self._refresh_lock:
+            inflight = self._refresh_inflight.get(key)
+            if inflight is None:
+                future: Future = Future()
+                self._refresh_inflight[key] = future
+
+        if inflight is not None:
+            return inflight.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._refresh_lock:
+                del self._refresh_inflight[key]
 
     def authenticate(self, force_reauth: bool = False) -> Tuple[str, str]:
         """Authenticate and return identity token and user email.
@@ -76,22 +264,26 @@ class GoogleCloudAuth:
                 logger.warning(f"Failed to get identity token from gcloud: {e}")
                 logger.info("Falling back to OAuth flow")
 
-            # Use the OAuth flow as fallback
-            if force_reauth or not self._load_stored_credentials():
+            # Use the OAuth flow as fallback; credentials already in memory may
+            # be newer than the stored copy
+            if force_reauth or (
+                self._credentials is None and not self._load_stored_credentials()
+            ):
                 self._perform_oauth_flow()
 
             # Ensure credentials are fresh
-            if self._credentials and self._credentials.expired:
+            if self._credentials and self._should_refresh():
                 self._refresh_credentials()
+            elif self._credentials and self._should_refresh_in_background():
+                self._start_background_refresh()
 
             if not self._credentials:
                 raise AuthenticationError("Failed to obtain valid credentials")
 
             # Use ID token (JWT format) which is what the API expects
             # But without audience claims to avoid rejection
-            if hasattr(self._credentials, "id_token") and self._credentials.id_token:
-                id_token = self._credentials.id_token
-            else:
+            id_token = getattr(self._credentials, "id_token", None)
+            if not id_token:
                 raise AuthenticationError("Failed to obtain ID token from credentials")
 
             # Extract user email from credentials
@@ -112,13 +304,17 @@ class GoogleCloudAuth:
         Returns:
             True if credentials were loaded successfully, False otherwise
         """
-        if not self.credentials_path.exists():
+        try:
+            raw_data = self.credentials_path.read_bytes()
+        except FileNotFoundError:
             logger.debug(f"No stored credentials found at {self.credentials_path}")
             return False
 
+        from google.oauth2.credentials import Credentials as OAuth2Credentials
+
         try:
-            with open(self.credentials_path, "r") as f:
-                cred_data = json.load(f)
+            cred_data = _json_loads(raw_data)
+            expiry = cred_data.get("expiry")
 
             # Create credentials from stored data
             self._credentials = OAuth2Credentials(
@@ -131,13 +327,14 @@ class GoogleCloudAuth:
                 client_id=cred_data.get("client_id"),
                 client_secret=cred_data.get("client_secret"),
                 scopes=cred_data.get("scopes", REQUIRED_SCOPES),
+                expiry=datetime.fromisoformat(expiry) if expiry else None,
             )
 
             self._user_email = cred_data.get("user_email")
             logger.debug("Successfully loaded stored credentials")
             return True
 
-        except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Failed to load stored credentials: {e}")
             return False
 
@@ -148,6 +345,8 @@ class GoogleCloudAuth:
             AuthenticationError: If OAuth flow fails
         """
         if not self.client_secrets_path or not self.client_secrets_path.exists():
+            from google.auth import default
+
             # Try to use application default credentials
             try:
                 self._credentials, project_id = default(scopes=REQUIRED_SCOPES)
@@ -161,6 +360,8 @@ class GoogleCloudAuth:
                 )
 
         try:
+            from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
+
             # Perform OAuth flow
             flow = InstalledAppFlow.from_client_secrets_file(
                 str(self.client_secrets_path), scopes=REQUIRED_SCOPES
@@ -180,29 +381,111 @@ class GoogleCloudAuth:
         except Exception as e:
             raise AuthenticationError(f"OAuth flow failed: {e}", cause=e)
 
-    def _refresh_credentials(self) -> None:
+    def _refresh_credentials(self, save: bool = True) -> None:
         """Refresh expired credentials.
 
+        Concurrent refreshes are coalesced into a single token request.
+
+        Args:
+            save: Whether to save the refreshed credentials to file
+
+        Raises:
+            TokenRefreshError: If token refresh fails
+        """
+        try:
+            self._run_single_flight(
+                "credentials", lambda: self._do_refresh_credentials(save)
+            )
+        finally:
+            self._is_auth_cache = None
+
+    def _do_refresh_credentials(self, save: bool = True) -> None:
+        """Refresh expired credentials unconditionally.
+
+        Args:
+            save: Whether to save the refreshed credentials to file
+
         Raises:
             TokenRefreshError: If token refresh fails
         """
         if not self._credentials:
             raise TokenRefreshError("No credentials available to refresh")
 
+        from google.auth.transport.requests import Request
+
         try:
             request = Request()
             self._credentials.refresh(request)
             logger.debug("Successfully refreshed credentials")
 
             # Save refreshed credentials
-            self._save_credentials()
+            if save:
+                self._save_credentials()
 
         except RefreshError as e:
             raise TokenRefreshError(f"Failed to refresh credentials: {e}", cause=e)
 
+    def _time_until_expiry(self) -> Optional[timedelta]:
+        """Get the remaining lifetime of the current credentials.
+
+        Returns:
+            Time until the credentials expire, or None if unknown
+        """
+        expiry = getattr(self._credentials, "expiry", None)
+        if not isinstance(expiry, datetime):
+            return None
+
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc)
+        if expiry.tzinfo is None:
+            now = now.replace(tzinfo=None)
+        return expiry - now
+
+    def _should_refresh(self) -> bool:
+        """Check if credentials must be refreshed before they are used.
+
+        Returns:
+            True if credentials are expired or about to expire
+        """
+        remaining = self._time_until_expiry()
+        if remaining is None:
+            return bool(self._credentials and self._credentials.expired)
+        return remaining < CREDENTIALS_REFRESH_MARGIN
+
+    def _should_refresh_in_background(self) -> bool:
+        """Check if credentials should be refreshed ahead of time.
+
+        Returns:
+            True if credentials are still usable but will expire soon
+        """
+        remaining = self._time_until_expiry()
+        return (
+            remaining is not None and remaining < CREDENTIALS_BACKGROUND_REFRESH_MARGIN
+        )
+
+    def _start_background_refresh(self) -> None:
+        """Refresh credentials in a daemon thread unless already refreshing."""
+        with self._refresh_lock:
+            if "credentials" in self._refresh_inflight:
+                return
+
+        def refresh() -> None:
+            # Failures must not surface from the daemon thread; the next
+            # foreground call refreshes and reports them instead. Nothing is
+            # saved, since the thread may be killed mid-write at exit
+            try:
+                self._refresh_credentials(save=False)
+            except (AuthenticationError, GoogleAuthError) as e:
+                logger.debug(f"Background credential refresh failed: {e}")
+
+        threading.Thread(target=refresh, daemon=True).start()
+
     def _extract_user_email(self) -> Optional[str]:
         """Extract user email from credentials.
 
+        The email decoded from the current ID token is remembered, so a
+        token is only decoded once per rotation.
+
         Returns:
             User email if available, None otherwise
         """
@@ -210,33 +493,23 @@ class GoogleCloudAuth:
             return self._user_email
 
         # Try to get email from token info
-        if (
-            self._credentials
-            and hasattr(self._credentials, "id_token")
-            and self._credentials.id_token
-        ):
+        id_token = getattr(self._credentials, "id_token", None)
+        if id_token:
+            if id_token == self._last_decoded_id_token:
+                self._user_email = self._last_decoded_email
+                return self._user_email
+
             try:
-                # Decode JWT token to extract email
-                import base64
-                import json
-
-                # JWT tokens have three parts separated by dots
-                parts = self._credentials.id_token.split(".")
-                if len(parts) >= 2:
-                    # Decode the payload (second part)
-                    payload = parts[1]
-                    # Add padding if needed
-                    padding = len(payload) % 4
-                    if padding:
-                        payload += "=" * (4 - padding)
-
-                    decoded = base64.urlsafe_b64decode(payload)
-                    token_data = json.loads(decoded.decode("utf-8"))
+                token_data = _decode_jwt_payload(id_token)
+                if token_data:
                     self._user_email = token_data.get("email")
 
             except Exception as e:
                 logger.warning(f"Failed to extract email from ID token: {e}")
 
+            self._last_decoded_id_token = id_token
+            self._last_decoded_email = self._user_email
+
         return self._user_email
 
     def _save_credentials(self) -> None:
@@ -249,6 +522,7 @@ class GoogleCloudAuth:
 
         # Extract user email before saving
         user_email = self._extract_user_email()
+        expiry = getattr(self._credentials, "expiry", None)
 
         cred_data = {
             "token": self._credentials.token,
@@ -261,19 +535,31 @@ class GoogleCloudAuth:
             ),
             "scopes": getattr(self._credentials, "scopes", REQUIRED_SCOPES),
             "user_email": user_email,
+            "expiry": expiry.isoformat() if isinstance(expiry, datetime) else None,
         }
 
+        tmp_path: Optional[str] = None
         try:
-            with open(self.credentials_path, "w") as f:
-                json.dump(cred_data, f, indent=2)
-
-            # Secure the credentials file
-            os.chmod(self.credentials_path, 0o600)
+            # mkstemp creates the file with mode 0o600, so the credentials are
+            # never readable by others, and os.replace swaps them in atomically
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.credentials_path.parent,
+                prefix=f".{self.credentials_path.name}.",
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps(cred_data))
+            os.replace(tmp_path, self.credentials_path)
+            tmp_path = None
             logger.debug(f"Saved credentials to {self.credentials_path}")
 
         except Exception as e:
             logger.warning(f"Failed to save credentials: {e}")
 
+        finally:
+            if tmp_path:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+
     def get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers for API requests.
 
@@ -290,17 +576,71 @@ class GoogleCloudAuth:
             "X-User-Email": user_email,
         }
 
+    def invalidate_cached_token(self) -> bool:
+        """Discard the current token so the next call uses a newly issued one.
+
+        Used when the API rejects a token before its advertised expiry. A
+        cached gcloud/ADC identity token is replaced by a forcibly refreshed
+        one; otherwise stored OAuth credentials are refreshed if they have a
+        refresh token.
+
+        Returns:
+            True if a new token will be used, False if nothing was invalidated
+        """
+        self._is_auth_cache = None
+
+        rejected_token = self._cached_id_token
+        if rejected_token is not None:
+            self._cached_id_token = None
+            self._cached_id_token_exp = 0.0
+            try:
+                identity_token, _ = self._run_single_flight(
+                    "identity_token",
+                    lambda: self._fetch_identity_token(force_refresh=True),
+                )
+            except AuthenticationError as e:
+                logger.debug(f"Failed to refresh rejected identity token: {e}")
+                return False
+            # gcloud may hand back its own cached token despite the refresh
+            return identity_token != rejected_token
+
+        if self._credentials is None or not getattr(
+            self._credentials, "refresh_token", None
+        ):
+            return False
+
+        try:
+            self._refresh_credentials()
+        except (AuthenticationError, GoogleAuthError) as e:
+            logger.debug(f"Failed to refresh rejected credentials: {e}")
+            return False
+        return True
+
     def logout(self) -> None:
         """Remove stored credentials."""
-        if self.credentials_path.exists():
+        try:
             self.credentials_path.unlink()
             logger.info("Stored credentials removed")
+        except FileNotFoundError:
+            pass
 
         self._credentials = None
         self._user_email = None
+        self._cached_id_token = None
+        self._cached_id_token_exp = 0.0
+        self._cached_user_email = None
+        self._last_decoded_id_token = None
+        self._last_decoded_email = None
+        self._is_auth_cache = None
 
     def _get_identity_token_without_audience(self) -> Tuple[str, str]:
-        """Get identity token without audience using gcloud.
+        """Get identity token without audience.
+
+        Application default credentials are used when they can provide an
+        identity token; the gcloud CLI is only invoked as a fallback. The
+        token is cached in memory and reused until it is within
+        TOKEN_EXPIRY_SKEW_SECONDS of its expiry; concurrent callers share a
+        single fetch.
 
         Returns:
             Tuple of (identity_token, user_email)
@@ -308,120 +648,266 @@ class GoogleCloudAuth:
         Raises:
             AuthenticationError: If getting identity token fails
         """
-        try:
-            # Use gcloud auth print-identity-token without audience
-            cmd = ["gcloud", "auth", "print-identity-token"]
+        cached = self._get_cached_identity_token()
+        if cached:
+            return cached
 
-            logger.debug(f"Running command: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
+        return self._run_single_flight("identity_token", self._fetch_identity_token)
+
+    def _get_cached_identity_token(self) -> Optional[Tuple[str, str]]:
+        """Get the cached identity token unless it is about to expire.
+
+        Returns:
+            Tuple of (identity_token, user_email), or None if a new token is needed
+        """
+        if (
+            self._cached_id_token
+            and self._cached_user_email
+            and self._cached_id_token_exp - time.time() > TOKEN_EXPIRY_SKEW_SECONDS
+        ):
+            return self._cached_id_token, self._cached_user_email
+        return None
+
+    def _fetch_identity_token(self, force_refresh: bool = False) -> Tuple[str, str]:
+        """Fetch a new identity token and cache it.
+
+        Args:
+            force_refresh: Bypass the cached token and the credential caches of
+                ADC and gcloud
+
+        Returns:
+            Tuple of (identity_token, user_email)
+
+        Raises:
+            AuthenticationError: If getting identity token fails
+        """
+        # Another flight may have refreshed the cache since the caller checked
+        cached = None if force_refresh else self._get_cached_identity_token()
+        if cached:
+            return cached
+
+        gcloud_account = None
+        try:
+            identity_token = self._get_adc_identity_token(force_refresh)
+        except AuthenticationError as e:
+            logger.debug(f"Falling back to gcloud for identity token: {e}")
+            credential, gcloud_account = self._get_gcloud_credential(force_refresh)
+            identity_token = credential.get("id_token") or self._run_gcloud(
+                ["auth", "print-identity-token"]
             )
 
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() or "Failed to get identity token"
-                if (
-                    "not logged in" in error_msg.lower()
-                    or "no active account" in error_msg.lower()
-                ):
-                    raise AuthenticationError(
-                        "Not authenticated with gcloud. Please run 'gcloud auth login' "
-                        "first, or use 'gcphcp auth login' for OAuth flow."
-                    )
+        # ADC may be a different principal than the gcloud account, so the
+        # token's own email claim wins; the active account rarely changes
+        # within a process lifetime
+        token_data = _decode_jwt_payload(identity_token) or {}
+        user_email = (
+            token_data.get("email")
+            or self._cached_user_email
+            or gcloud_account
+            or self._get_active_account()
+        )
+
+        self._cached_id_token = identity_token
+        self._cached_id_token_exp = float(token_data.get("exp", 0))
+        self._cached_user_email = user_email
+
+        logger.debug("Successfully obtained identity token without audience")
+        return identity_token, user_email
+
+    def _get_identity_token_with_audience(self) -> Tuple[str, str]:
+        """Get access token for the active account.
+
+        An access token is used instead of an identity token since the API
+        rejects JWTs with audience claims.
+
+        Returns:
+            Tuple of (access_token, user_email)
+
+        Raises:
+            AuthenticationError: If getting access token fails
+        """
+        account = None
+        try:
+            credentials = self._get_adc_credentials()
+            access_token = credentials.token
+            if not access_token:
                 raise AuthenticationError(
-                    f"gcloud auth print-identity-token failed: {error_msg}"
+                    "Application default credentials returned empty access token"
                 )
+            # Report the ADC principal rather than the gcloud account
+            token_data = (
+                _decode_jwt_payload(getattr(credentials, "id_token", None) or "") or {}
+            )
+            account = token_data.get("email") or getattr(
+                credentials, "service_account_email", None
+            )
+        except AuthenticationError as e:
+            logger.debug(f"Falling back to gcloud for access token: {e}")
+            credential, account = self._get_gcloud_credential()
+            access_token = credential.get("access_token") or self._run_gcloud(
+                ["auth", "print-access-token"]
+            )
 
-            identity_token = result.stdout.strip()
-            if not identity_token:
-                raise AuthenticationError("gcloud returned empty identity token")
+        logger.debug("Successfully obtained access token")
+        return access_token, account or self._get_active_account()
 
-            # Get user email from gcloud
-            email_cmd = ["gcloud", "config", "get-value", "account"]
-            email_result = subprocess.run(
-                email_cmd,
-                capture_output=True,
-                text=True,
-                timeout=10,
+    def _get_adc_credentials(self, force_refresh: bool = False) -> Credentials:
+        """Load application default credentials, refreshing them if needed.
+
+        ADC is only looked up when a source for it exists, and a failed
+        lookup is not retried for the lifetime of this instance.
+
+        Args:
+            force_refresh: Refresh the credentials even if they are still valid
+
+        Returns:
+            Valid application default credentials
+
+        Raises:
+            AuthenticationError: If no usable default credentials are available
+        """
+        if self._adc_unavailable:
+            raise AuthenticationError("Application default credentials unavailable")
+        if not _adc_source_available():
+            self._adc_unavailable = True
+            raise AuthenticationError("No application default credentials configured")
+
+        from google.auth import default
+        from google.auth.transport.requests import Request
+
+        try:
+            credentials, _ = default(scopes=REQUIRED_SCOPES)
+            if force_refresh or credentials.expired or not credentials.token:
+                credentials.refresh(Request())
+        except GoogleAuthError as e:
+            # Includes transport failures, so callers fall back to gcloud
+            self._adc_unavailable = True
+            raise AuthenticationError(
+                f"Application default credentials unavailable: {e}", cause=e
             )
 
-            user_email = (
-                email_result.stdout.strip()
-                if email_result.returncode == 0
-                else "unknown@example.com"
+        return credentials
+
+    def _get_adc_identity_token(self, force_refresh: bool = False) -> str:
+        """Get an identity token from application default credentials.
+
+        Args:
+            force_refresh: Refresh the credentials even if they are still valid
+
+        Returns:
+            Identity token
+
+        Raises:
+            AuthenticationError: If the credentials cannot provide an identity token
+        """
+        credentials = self._get_adc_credentials(force_refresh)
+        identity_token = getattr(credentials, "id_token", None)
+
+        if not identity_token and self.audience:
+            from google.auth.transport.requests import Request
+            from google.oauth2 import id_token as google_id_token
+
+            try:
+                identity_token = google_id_token.fetch_id_token(
+                    Request(), self.audience
+                )
+            except (GoogleAuthError, ValueError) as e:
+                self._adc_unavailable = True
+                raise AuthenticationError(
+                    f"Failed to fetch identity token: {e}", cause=e
+                )
+
+        if not identity_token:
+            self._adc_unavailable = True
+            raise AuthenticationError(
+                "Application default credentials did not provide an identity token"
             )
 
-            logger.debug("Successfully obtained identity token without audience")
-            return identity_token, user_email
+        return identity_token
 
-        except subprocess.TimeoutExpired:
-            raise AuthenticationError("Timeout while calling gcloud command")
-        except FileNotFoundError:
+    def _get_gcloud_credential(
+        self, force_refresh: bool = False
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Get the active gcloud credential and account in one invocation.
+
+        Args:
+            force_refresh: Make gcloud refresh its credential even if it is
+                still valid
+
+        Returns:
+            Tuple of (credential, account) where credential holds the
+            access_token, id_token and token_expiry reported by gcloud
+
+        Raises:
+            AuthenticationError: If gcloud fails or returns invalid output
+        """
+        args = ["config", "config-helper", "--format=json"]
+        if force_refresh:
+            args.append("--force-auth-refresh")
+        output = self._run_gcloud(args)
+        try:
+            helper_data = json.loads(output)
+        except json.JSONDecodeError as e:
             raise AuthenticationError(
-                "gcloud command not found. Install Google Cloud SDK or use OAuth flow."
+                f"Failed to parse gcloud config-helper output: {e}", cause=e
             )
-        except Exception as e:
-            raise AuthenticationError(f"Failed to get identity token: {e}", cause=e)
 
-    def _get_identity_token_with_audience(self) -> Tuple[str, str]:
-        """Get identity token with specific audience using gcloud.
+        credential = helper_data.get("credential") or {}
+        account = (
+            helper_data.get("configuration", {})
+            .get("properties", {})
+            .get("core", {})
+            .get("account")
+        )
+        return credential, account
+
+    def _run_gcloud(self, args: List[str]) -> str:
+        """Run a gcloud command and return its output.
+
+        Args:
+            args: gcloud arguments (e.g. ["auth", "print-identity-token"])
 
         Returns:
-            Tuple of (identity_token, user_email)
+            Output printed by gcloud
 
         Raises:
-            AuthenticationError: If getting identity token fails
+            AuthenticationError: If the command fails
         """
         try:
-            # Use gcloud auth print-access-token instead of identity token
-            # since the API rejects JWTs with audience claims
-            cmd = ["gcloud", "auth", "print-access-token"]
+            cmd = ["gcloud"] + args
 
             logger.debug(f"Running command: {' '.join(cmd)}")
+            # Output is decoded by hand rather than through the locale codec
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 timeout=30,
             )
 
             if result.returncode != 0:
-                error_msg = result.stderr.strip() or "Failed to get access token"
+                error_msg = (
+                    result.stderr.decode("utf-8", errors="replace").strip()
+                    or "Failed to get token"
+                )
                 if (
                     "not logged in" in error_msg.lower()
                     or "no active account" in error_msg.lower()
+                    or "do not currently have an active account" in error_msg.lower()
                 ):
                     raise AuthenticationError(
                         "Not authenticated with gcloud. Please run 'gcloud auth login' "
                         "first, or use 'gcphcp auth login' for OAuth flow."
                     )
                 raise AuthenticationError(
-                    f"gcloud auth print-access-token failed: {error_msg}"
+                    f"gcloud {' '.join(args)} failed: {error_msg}"
                 )
 
-            access_token = result.stdout.strip()
-            if not access_token:
-                raise AuthenticationError("gcloud returned empty access token")
-
-            # Get user email from gcloud
-            email_cmd = ["gcloud", "config", "get-value", "account"]
-            email_result = subprocess.run(
-                email_cmd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
+            output = result.stdout.decode("utf-8").strip()
+            if not output:
+                raise AuthenticationError(f"gcloud {' '.join(args)} returned no output")
 
-            user_email = (
-                email_result.stdout.strip()
-                if email_result.returncode == 0
-                else "unknown@example.com"
-            )
-
-            logger.debug("Successfully obtained access token")
-            return access_token, user_email
+            return output
 
         except subprocess.TimeoutExpired:
             raise AuthenticationError("Timeout while calling gcloud command")
@@ -432,21 +918,62 @@ class GoogleCloudAuth:
         except Exception as e:
             raise AuthenticationError(f"Failed to get identity token: {e}", cause=e)
 
+    def _get_active_account(self) -> str:
+        """Get the active gcloud account.
+
+        The gcloud configuration files are read directly; the gcloud CLI is
+        only invoked when they are not available.
+
+        Returns:
+            Active account email, or a placeholder if it cannot be determined
+        """
+        account = _read_gcloud_account()
+        if account:
+            return account
+
+        try:
+            email_result = subprocess.run(
+                ["gcloud", "config", "get-value", "account"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=10,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return "unknown@example.com"
+
+        return (
+            email_result.stdout.decode("utf-8").strip()
+            if email_result.returncode == 0
+            else "unknown@example.com"
+        )
+
     def is_authenticated(self) -> bool:
         """Check if user is currently authenticated.
 
+        The result is reused for AUTH_STATUS_CACHE_SECONDS while credentials
+        are loaded.
+
         Returns:
             True if authenticated with valid credentials, False otherwise
         """
+        if (
+            self._is_auth_cache
+            and self._credentials is not None
+            and time.monotonic() - self._is_auth_cache[0] < AUTH_STATUS_CACHE_SECONDS
+        ):
+            return self._is_auth_cache[1]
+
         try:
             if not self._credentials and not self._load_stored_credentials():
                 return False
 
-            # Check if credentials are valid and not expired
-            if self._credentials and self._credentials.expired:
+            # Check if credentials are valid and not about to expire
+            if self._credentials and self._should_refresh():
                 self._refresh_credentials()
 
-            return bool(self._credentials and self._credentials.token)
+            result = bool(self._credentials and self._credentials.token)
+            self._is_auth_cache = (time.monotonic(), result)
+            return result
 
         except Exception:
             return False
@@ -243,15 +243,47 @@ class APIClient:
         """
         url = self._build_url(path)
 
+        logger.debug(f"Making {method} request to {url}")
+        response = self._send_request(method, url, params, json_data, headers)
+
+        # The token may have been revoked or rotated before its expiry; retry
+        # once if a freshly issued one is available
+        if response.status_code == 401 and self.auth.invalidate_cached_token():
+            logger.debug("Request was unauthorized, retrying with a fresh token")
+            response = self._send_request(method, url, params, json_data, headers)
+
+        return self._handle_response(response)
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Send an authenticated HTTP request over the shared session.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Query parameters
+            json_data: JSON data for request body
+            headers: Additional headers
+
+        Returns:
+            HTTP response object
+
+        Raises:
+            APIError: If the request could not be sent
+        """
         # Prepare headers
         request_headers = self._get_auth_headers()
         if headers:
             request_headers.update(headers)
 
-        logger.debug(f"Making {method} request to {url}")
-
         try:
-            response = self.session.request(
+            return self.session.request(
                 method=method,
                 url=url,
                 params=params,
@@ -260,8 +292,6 @@ class APIClient:
                 timeout=self.timeout,
             )
 
-            return self._handle_response(response)
-
         except Timeout as e:
             raise APITimeoutError(
                 f"Request to {url} timed out after {self.timeout} seconds"
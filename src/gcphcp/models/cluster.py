@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class ClusterCondition(BaseModel):
@@ -75,12 +75,10 @@ class Cluster(BaseModel):
         default=None, description="Last update timestamp"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-        }
+    @field_serializer("createdAt", "updatedAt", when_used="json")
+    def _serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
+        """Serialize timestamps as ISO-8601 strings."""
+        return value.isoformat() if value else None
 
     def get_display_status(self) -> str:
         """Get human-readable status.
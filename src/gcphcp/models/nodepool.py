@@ -1,107 +1,344 @@
 """NodePool data models for GCP HCP CLI."""
 
-from datetime import datetime
+import functools
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+# Parsed timestamps are memoized: conditions and nodepools that changed
+# together share timestamp strings, and datetimes are immutable.
+_PARSE_ISO_CACHE_SIZE = 4096
 
+if sys.version_info >= (3, 11):
+    # Python 3.11+ parses the trailing "Z" natively
+    _parse_iso = functools.lru_cache(maxsize=_PARSE_ISO_CACHE_SIZE)(
+        datetime.fromisoformat
+    )
+else:
+
+    @functools.lru_cache(maxsize=_PARSE_ISO_CACHE_SIZE)
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp with a possible trailing "Z".
+
+        Args:
+            value: Timestamp string
+
+        Returns:
+            Parsed datetime
+        """
+        return datetime.fromisoformat(
+            value[:-1] + "+00:00" if value.endswith("Z") else value
+        )
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an optional ISO-8601 timestamp from the API.
+
+    Args:
+        value: Timestamp string, possibly with a trailing "Z"
+
+    Returns:
+        Parsed datetime, or None if no value was given
+    """
+    return _parse_iso(value) if value else None
 
-class NodePoolCondition(BaseModel):
+
+def _format_age(delta: timedelta) -> str:
+    """Format an age as a human-readable string.
+
+    Args:
+        delta: Time elapsed since creation
+
+    Returns:
+        Age string (e.g., "2d", "5h", "30m")
+    """
+    total_seconds = int(delta.total_seconds())
+    if total_seconds >= 86400:
+        return f"{total_seconds // 86400}d"
+    elif total_seconds > 3600:
+        return f"{total_seconds // 3600}h"
+    elif total_seconds > 60:
+        return f"{total_seconds // 60}m"
+    else:
+        return f"{total_seconds}s"
+
+
+@dataclass
+class NodePoolCondition:
     """Represents a nodepool condition."""
 
-    type: str = Field(description="Type of condition")
-    status: str = Field(description="Status of condition (True/False/Unknown)")
-    lastTransitionTime: Optional[datetime] = Field(
-        default=None, description="Last transition time"
+    type: str = field(metadata={"description": "Type of condition"})
+    status: str = field(
+        metadata={"description": "Status of condition (True/False/Unknown)"}
+    )
+    lastTransitionTime: Optional[datetime] = field(
+        default=None, metadata={"description": "Last transition time"}
+    )
+    reason: Optional[str] = field(
+        default=None, metadata={"description": "Reason for condition"}
+    )
+    message: Optional[str] = field(
+        default=None, metadata={"description": "Human-readable message"}
     )
-    reason: Optional[str] = Field(default=None, description="Reason for condition")
-    message: Optional[str] = Field(default=None, description="Human-readable message")
 
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> "NodePoolCondition":
+        """Create condition from API response data.
 
-class NodePoolStatus(BaseModel):
+        Args:
+            data: API response data
+
+        Returns:
+            NodePoolCondition instance
+        """
+        return cls(
+            type=data["type"],
+            status=data["status"],
+            lastTransitionTime=_parse_datetime(data.get("lastTransitionTime")),
+            reason=data.get("reason"),
+            message=data.get("message"),
+        )
+
+
+@dataclass
+class NodePoolStatus:
     """Represents nodepool status information."""
 
-    phase: Optional[str] = Field(
-        default=None, description="Current phase of the nodepool"
+    phase: Optional[str] = field(
+        default=None, metadata={"description": "Current phase of the nodepool"}
+    )
+    message: Optional[str] = field(
+        default=None, metadata={"description": "Status message"}
+    )
+    generation: Optional[int] = field(
+        default=None, metadata={"description": "Generation number"}
     )
-    message: Optional[str] = Field(default=None, description="Status message")
-    generation: Optional[int] = Field(default=None, description="Generation number")
-    resourceVersion: Optional[str] = Field(default=None, description="Resource version")
-    conditions: List[NodePoolCondition] = Field(
-        default_factory=list, description="NodePool conditions"
+    resourceVersion: Optional[str] = field(
+        default=None, metadata={"description": "Resource version"}
     )
-    nodeCount: Optional[int] = Field(
-        default=None, description="Current number of nodes"
+    conditions: List[NodePoolCondition] = field(
+        default_factory=list, metadata={"description": "NodePool conditions"}
     )
-    readyNodeCount: Optional[int] = Field(
-        default=None, description="Number of ready nodes"
+    nodeCount: Optional[int] = field(
+        default=None, metadata={"description": "Current number of nodes"}
     )
+    readyNodeCount: Optional[int] = field(
+        default=None, metadata={"description": "Number of ready nodes"}
+    )
+
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> "NodePoolStatus":
+        """Create status from API response data.
 
+        Args:
+            data: API response data
 
-class NodePoolManagement(BaseModel):
+        Returns:
+            NodePoolStatus instance
+        """
+        return cls(
+            phase=data.get("phase"),
+            message=data.get("message"),
+            generation=data.get("generation"),
+            resourceVersion=data.get("resourceVersion"),
+            conditions=[
+                NodePoolCondition.from_api_response(cond)
+                for cond in data.get("conditions") or []
+            ],
+            nodeCount=data.get("nodeCount"),
+            readyNodeCount=data.get("readyNodeCount"),
+        )
+
+
+@dataclass
+class NodePoolManagement:
     """Represents nodepool management configuration."""
 
-    autoRepair: Optional[bool] = Field(default=None, description="Enable auto-repair")
-    autoUpgrade: Optional[bool] = Field(default=None, description="Enable auto-upgrade")
-    upgradeType: Optional[str] = Field(
-        default=None, description="Upgrade strategy type"
+    autoRepair: Optional[bool] = field(
+        default=None, metadata={"description": "Enable auto-repair"}
+    )
+    autoUpgrade: Optional[bool] = field(
+        default=None, metadata={"description": "Enable auto-upgrade"}
+    )
+    upgradeType: Optional[str] = field(
+        default=None, metadata={"description": "Upgrade strategy type"}
     )
 
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> "NodePoolManagement":
+        """Create management configuration from API response data.
 
-class NodePoolSpec(BaseModel):
+        Args:
+            data: API response data
+
+        Returns:
+            NodePoolManagement instance
+        """
+        return cls(
+            autoRepair=data.get("autoRepair"),
+            autoUpgrade=data.get("autoUpgrade"),
+            upgradeType=data.get("upgradeType"),
+        )
+
+
+@dataclass
+class NodePoolSpec:
     """Represents nodepool specification."""
 
-    clusterId: str = Field(description="Parent cluster ID")
-    machineType: Optional[str] = Field(default=None, description="GCP machine type")
-    diskSize: Optional[int] = Field(default=None, description="Boot disk size in GB")
-    nodeCount: Optional[int] = Field(
-        default=None, description="Desired number of nodes"
+    clusterId: str = field(metadata={"description": "Parent cluster ID"})
+    machineType: Optional[str] = field(
+        default=None, metadata={"description": "GCP machine type"}
     )
-    minNodeCount: Optional[int] = Field(
-        default=None, description="Minimum number of nodes"
+    diskSize: Optional[int] = field(
+        default=None, metadata={"description": "Boot disk size in GB"}
     )
-    maxNodeCount: Optional[int] = Field(
-        default=None, description="Maximum number of nodes"
+    nodeCount: Optional[int] = field(
+        default=None, metadata={"description": "Desired number of nodes"}
     )
-    management: Optional[NodePoolManagement] = Field(
-        default=None, description="Management configuration"
+    minNodeCount: Optional[int] = field(
+        default=None, metadata={"description": "Minimum number of nodes"}
     )
-    labels: Optional[Dict[str, str]] = Field(default=None, description="Node labels")
-    taints: Optional[List[Dict[str, Any]]] = Field(
-        default=None, description="Node taints"
+    maxNodeCount: Optional[int] = field(
+        default=None, metadata={"description": "Maximum number of nodes"}
     )
+    management: Optional[NodePoolManagement] = field(
+        default=None, metadata={"description": "Management configuration"}
+    )
+    labels: Optional[Dict[str, str]] = field(
+        default=None, metadata={"description": "Node labels"}
+    )
+    taints: Optional[List[Dict[str, Any]]] = field(
+        default=None, metadata={"description": "Node taints"}
+    )
+
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> "NodePoolSpec":
+        """Create specification from API response data.
 
+        Args:
+            data: API response data
 
-class NodePool(BaseModel):
+        Returns:
+            NodePoolSpec instance
+        """
+        management = data.get("management")
+        return cls(
+            clusterId=data["clusterId"],
+            machineType=data.get("machineType"),
+            diskSize=data.get("diskSize"),
+            nodeCount=data.get("nodeCount"),
+            minNodeCount=data.get("minNodeCount"),
+            maxNodeCount=data.get("maxNodeCount"),
+            management=(
+                NodePoolManagement.from_api_response(management) if management else None
+            ),
+            labels=data.get("labels"),
+            taints=data.get("taints"),
+        )
+
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as an ISO-8601 string.
+
+    Args:
+        value: Datetime to format
+
+    Returns:
+        ISO-8601 string, or None if no value was given
+    """
+    return value.isoformat() if value else None
+
+
+def _dump_status(status: NodePoolStatus) -> Dict[str, Any]:
+    """Serialize nodepool status to a JSON-compatible dictionary.
+
+    Args:
+        status: NodePool status
+
+    Returns:
+        Status dictionary
+    """
+    format_datetime = _format_datetime
+    return {
+        "phase": status.phase,
+        "message": status.message,
+        "generation": status.generation,
+        "resourceVersion": status.resourceVersion,
+        "conditions": [
+            {
+                "type": cond.type,
+                "status": cond.status,
+                "lastTransitionTime": format_datetime(cond.lastTransitionTime),
+                "reason": cond.reason,
+                "message": cond.message,
+            }
+            for cond in status.conditions
+        ],
+        "nodeCount": status.nodeCount,
+        "readyNodeCount": status.readyNodeCount,
+    }
+
+
+def _dump_spec(spec: NodePoolSpec) -> Dict[str, Any]:
+    """Serialize nodepool specification to a JSON-compatible dictionary.
+
+    Args:
+        spec: NodePool specification
+
+    Returns:
+        Specification dictionary
+    """
+    management = spec.management
+    return {
+        "clusterId": spec.clusterId,
+        "machineType": spec.machineType,
+        "diskSize": spec.diskSize,
+        "nodeCount": spec.nodeCount,
+        "minNodeCount": spec.minNodeCount,
+        "maxNodeCount": spec.maxNodeCount,
+        "management": (
+            {
+                "autoRepair": management.autoRepair,
+                "autoUpgrade": management.autoUpgrade,
+                "upgradeType": management.upgradeType,
+            }
+            if management
+            else None
+        ),
+        "labels": spec.labels,
+        "taints": spec.taints,
+    }
+
+
+@dataclass
+class NodePool:
     """Represents a nodepool resource."""
 
-    id: str = Field(description="Unique nodepool identifier")
-    name: str = Field(description="NodePool name")
-    clusterId: str = Field(description="Parent cluster ID")
-    createdBy: Optional[str] = Field(
-        default=None, description="User who created the nodepool"
+    id: str = field(metadata={"description": "Unique nodepool identifier"})
+    name: str = field(metadata={"description": "NodePool name"})
+    clusterId: str = field(metadata={"description": "Parent cluster ID"})
+    createdBy: Optional[str] = field(
+        default=None, metadata={"description": "User who created the nodepool"}
     )
-    generation: Optional[int] = Field(default=None, description="Generation number")
-    resourceVersion: Optional[str] = Field(default=None, description="Resource version")
-    spec: Optional[NodePoolSpec] = Field(
-        default=None, description="NodePool specification"
+    generation: Optional[int] = field(
+        default=None, metadata={"description": "Generation number"}
     )
-    status: Optional[NodePoolStatus] = Field(
-        default=None, description="NodePool status"
+    resourceVersion: Optional[str] = field(
+        default=None, metadata={"description": "Resource version"}
     )
-    createdAt: Optional[datetime] = Field(
-        default=None, description="Creation timestamp"
+    spec: Optional[NodePoolSpec] = field(
+        default=None, metadata={"description": "NodePool specification"}
     )
-    updatedAt: Optional[datetime] = Field(
-        default=None, description="Last update timestamp"
+    status: Optional[NodePoolStatus] = field(
+        default=None, metadata={"description": "NodePool status"}
+    )
+    createdAt: Optional[datetime] = field(
+        default=None, metadata={"description": "Creation timestamp"}
+    )
+    updatedAt: Optional[datetime] = field(
+        default=None, metadata={"description": "Last update timestamp"}
     )
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-        }
 
     def get_display_status(self) -> str:
         """Get human-readable status.
@@ -147,19 +384,33 @@ class NodePool(BaseModel):
         if not self.createdAt:
             return "Unknown"
 
-        now = datetime.now(self.createdAt.tzinfo)
-        delta = now - self.createdAt
+        return _format_age(datetime.now(self.createdAt.tzinfo) - self.createdAt)
+
+    @staticmethod
+    def render_ages(pools: List["NodePool"]) -> List[str]:
+        """Get ages of several nodepools as human-readable strings.
+
+        The current time is read once for the whole list. Timestamps
+        without an offset are compared to local time, as in get_age().
 
-        if delta.days > 0:
-            return f"{delta.days}d"
-        elif delta.seconds > 3600:
-            hours = delta.seconds // 3600
-            return f"{hours}h"
-        elif delta.seconds > 60:
-            minutes = delta.seconds // 60
-            return f"{minutes}m"
-        else:
-            return f"{delta.seconds}s"
+        Args:
+            pools: NodePools to render
+
+        Returns:
+            Age strings in the same order as the nodepools
+        """
+        now = datetime.now(timezone.utc)
+        naive_now = now.astimezone().replace(tzinfo=None)
+        return [
+            (
+                _format_age(
+                    (now if pool.createdAt.tzinfo else naive_now) - pool.createdAt
+                )
+                if pool.createdAt
+                else "Unknown"
+            )
+            for pool in pools
+        ]
 
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "NodePool":
@@ -171,35 +422,76 @@ class NodePool(BaseModel):
         Returns:
             NodePool instance
         """
-        # Handle datetime fields
-        if "createdAt" in data and data["createdAt"]:
-            data["createdAt"] = datetime.fromisoformat(
-                data["createdAt"].replace("Z", "+00:00")
-            )
-        if "updatedAt" in data and data["updatedAt"]:
-            data["updatedAt"] = datetime.fromisoformat(
-                data["updatedAt"].replace("Z", "+00:00")
+        return cls.from_api_response_list([data])[0]
+
+    @classmethod
+    def from_api_response_list(
+        cls, data_list: List[Dict[str, Any]]
+    ) -> List["NodePool"]:
+        """Create nodepools from a list of API response items.
+
+        Lookups used for every item are bound once for the whole batch.
+
+        Args:
+            data_list: API response items
+
+        Returns:
+            List of NodePool instances
+        """
+        parse_datetime = _parse_datetime
+        spec_from_api = NodePoolSpec.from_api_response
+        status_from_api = NodePoolStatus.from_api_response
+
+        nodepools: List["NodePool"] = []
+        append = nodepools.append
+        for data in data_list:
+            get = data.get
+            spec = get("spec")
+            status = get("status")
+            append(
+                cls(
+                    id=data["id"],
+                    name=data["name"],
+                    clusterId=data["clusterId"],
+                    createdBy=get("createdBy"),
+                    generation=get("generation"),
+                    resourceVersion=get("resourceVersion"),
+                    spec=spec_from_api(spec) if spec else None,
+                    status=status_from_api(status) if status else None,
+                    createdAt=parse_datetime(get("createdAt")),
+                    updatedAt=parse_datetime(get("updatedAt")),
+                )
             )
+        return nodepools
+
+    @staticmethod
+    def dump_list(pools: List["NodePool"]) -> List[Dict[str, Any]]:
+        """Serialize nodepools to JSON-compatible dictionaries.
 
-        # Handle nested status
-        if "status" in data and data["status"]:
-            status_data = data["status"]
-            if "conditions" in status_data:
-                conditions = []
-                for cond in status_data["conditions"]:
-                    if "lastTransitionTime" in cond and cond["lastTransitionTime"]:
-                        cond["lastTransitionTime"] = datetime.fromisoformat(
-                            cond["lastTransitionTime"].replace("Z", "+00:00")
-                        )
-                    conditions.append(NodePoolCondition(**cond))
-                status_data["conditions"] = conditions
-            data["status"] = NodePoolStatus(**status_data)
-
-        # Handle spec
-        if "spec" in data and data["spec"]:
-            spec_data = data["spec"]
-            if "management" in spec_data and spec_data["management"]:
-                spec_data["management"] = NodePoolManagement(**spec_data["management"])
-            data["spec"] = NodePoolSpec(**spec_data)
-
-        return cls(**data)
+        Fields are listed explicitly instead of being introspected per
+        instance, and datetimes are rendered as ISO-8601 strings.
+
+        Args:
+            pools: NodePools to serialize
+
+        Returns:
+            List of nodepool dictionaries in API field naming
+        """
+        format_datetime = _format_datetime
+        dump_spec = _dump_spec
+        dump_status = _dump_status
+        return [
+            {
+                "id": pool.id,
+                "name": pool.name,
+                "clusterId": pool.clusterId,
+                "createdBy": pool.createdBy,
+                "generation": pool.generation,
+                "resourceVersion": pool.resourceVersion,
+                "spec": dump_spec(pool.spec) if pool.spec else None,
+                "status": dump_status(pool.status) if pool.status else None,
+                "createdAt": format_datetime(pool.createdAt),
+                "updatedAt": format_datetime(pool.updatedAt),
+            }
+            for pool in pools
+        ]
@@ -16,6 +16,7 @@ from gcphcp.client.exceptions import (
     ServerError,
     ValidationError,
 )
+from gcphcp.auth.exceptions import AuthenticationError
 from gcphcp.auth.google_auth import GoogleCloudAuth
 
 
@@ -233,6 +234,156 @@ class TestAPIClient:
         assert "Authorization" in call_args[1]["headers"]
         assert "X-User-Email" in call_args[1]["headers"]
 
+    @patch("gcphcp.client.api_client.requests.Session.request")
+    def test_make_request_retries_once_after_unauthorized(
+        self, mock_request, api_client, mock_auth
+    ):
+        """Test a 401 response triggers one retry with a fresh token."""
+        mock_auth.invalidate_cached_token.return_value = True
+        unauthorized = Mock()
+        unauthorized.status_code = 401
+        unauthorized.headers = {"Content-Type": "application/json"}
+        unauthorized.json.return_value = {"message": "Token expired"}
+        success = Mock()
+        success.status_code = 200
+        success.headers = {"Content-Type": "application/json"}
+        success.json.return_value = {"data": "success"}
+        mock_request.side_effect = [unauthorized, success]
+
+        result = api_client._make_request("GET", "/test")
+
+        assert result == {"data": "success"}
+        assert mock_request.call_count == 2
+        mock_auth.invalidate_cached_token.assert_called_once()
+
+    @patch("gcphcp.client.api_client.requests.Session.request")
+    def test_make_request_retries_with_refreshed_oauth_token(
+        self, mock_request, tmp_path
+    ):
+        """Test the retry after a 401 sends the refreshed OAuth ID token."""
+        auth = GoogleCloudAuth(credentials_path=tmp_path / "credentials.json")
+        mock_credentials = Mock()
+        mock_credentials.expired = False
+        mock_credentials.expiry = None
+        mock_credentials.refresh_token = "refresh_token"
+        mock_credentials.id_token = "rejected_token"
+        mock_credentials.refresh.side_effect = lambda request: setattr(
+            mock_credentials, "id_token", "new_token"
+        )
+        auth._credentials = mock_credentials
+        auth._user_email = "user@example.com"
+        client = APIClient(base_url="https://api.example.com", auth=auth)
+
+        unauthorized = Mock()
+        unauthorized.status_code = 401
+        unauthorized.headers = {"Content-Type": "application/json"}
+        unauthorized.json.return_value = {"message": "Token expired"}
+        success = Mock()
+        success.status_code = 200
+        success.headers = {"Content-Type": "application/json"}
+        success.json.return_value = {"data": "success"}
+        mock_request.side_effect = [unauthorized, success]
+
+        with patch.object(
+            auth,
+            "_get_identity_token_without_audience",
+            side_effect=AuthenticationError("gcloud unavailable"),
+        ), patch.object(
+            auth, "_load_stored_credentials", return_value=True
+        ), patch.object(
+            auth, "_save_credentials"
+        ):
+            result = client._make_request("GET", "/test")
+
+        assert result == {"data": "success"}
+        sent_tokens = [
+            call[1]["headers"]["Authorization"] for call in mock_request.call_args_list
+        ]
+        assert sent_tokens == ["Bearer rejected_token", "Bearer new_token"]
+
+    @patch("gcphcp.auth.google_auth._read_gcloud_account", return_value=None)
+    @patch("gcphcp.auth.google_auth._adc_source_available", return_value=False)
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    @patch("gcphcp.client.api_client.requests.Session.request")
+    def test_make_request_retries_with_refreshed_gcloud_token(
+        self, mock_request, mock_run, _, __, tmp_path
+    ):
+        """Test the retry after a 401 sends a token gcloud was forced to refresh."""
+        import base64
+        import json
+        import time
+
+        def config_helper_result(serial):
+            claims = {"exp": time.time() + 3600, "serial": serial}
+            payload = base64.urlsafe_b64encode(json.dumps(claims).encode())
+            id_token = f"header.{payload.decode().rstrip('=')}.signature"
+            output = {
+                "configuration": {
+                    "properties": {"core": {"account": "user@example.com"}}
+                },
+                "credential": {"access_token": "access_token", "id_token": id_token},
+            }
+            return Mock(returncode=0, stdout=json.dumps(output).encode()), id_token
+
+        rejected, rejected_token = config_helper_result(1)
+        refreshed, new_token = config_helper_result(2)
+        mock_run.side_effect = [rejected, refreshed]
+        auth = GoogleCloudAuth(credentials_path=tmp_path / "credentials.json")
+        client = APIClient(base_url="https://api.example.com", auth=auth)
+
+        unauthorized = Mock()
+        unauthorized.status_code = 401
+        unauthorized.headers = {"Content-Type": "application/json"}
+        unauthorized.json.return_value = {"message": "Token expired"}
+        success = Mock()
+        success.status_code = 200
+        success.headers = {"Content-Type": "application/json"}
+        success.json.return_value = {"data": "success"}
+        mock_request.side_effect = [unauthorized, success]
+
+        result = client._make_request("GET", "/test")
+
+        assert result == {"data": "success"}
+        assert "--force-auth-refresh" in mock_run.call_args_list[1][0][0]
+        sent_tokens = [
+            call[1]["headers"]["Authorization"] for call in mock_request.call_args_list
+        ]
+        assert sent_tokens == [f"Bearer {rejected_token}", f"Bearer {new_token}"]
+
+    @patch("gcphcp.client.api_client.requests.Session.request")
+    def test_make_request_unauthorized_without_new_token(
+        self, mock_request, api_client, mock_auth
+    ):
+        """Test a 401 is not retried when no new token can be obtained."""
+        mock_auth.invalidate_cached_token.return_value = False
+        unauthorized = Mock()
+        unauthorized.status_code = 401
+        unauthorized.headers = {"Content-Type": "application/json"}
+        unauthorized.json.return_value = {"message": "Token expired"}
+        mock_request.return_value = unauthorized
+
+        with pytest.raises(AuthenticationRequiredError):
+            api_client._make_request("GET", "/test")
+
+        assert mock_request.call_count == 1
+
+    @patch("gcphcp.client.api_client.requests.Session.request")
+    def test_make_request_unauthorized_after_retry(
+        self, mock_request, api_client, mock_auth
+    ):
+        """Test a repeated 401 response is raised after a single retry."""
+        mock_auth.invalidate_cached_token.return_value = True
+        unauthorized = Mock()
+        unauthorized.status_code = 401
+        unauthorized.headers = {"Content-Type": "application/json"}
+        unauthorized.json.return_value = {"message": "Token expired"}
+        mock_request.return_value = unauthorized
+
+        with pytest.raises(AuthenticationRequiredError):
+            api_client._make_request("GET", "/test")
+
+        assert mock_request.call_count == 2
+
     @patch("gcphcp.client.api_client.requests.Session.request")
     def test_make_request_timeout(self, mock_request, api_client):
         """Test request timeout handling."""
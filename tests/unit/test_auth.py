@@ -81,7 +81,7 @@ class TestGoogleCloudAuth:
             json.dump(valid_credentials_data, f)
 
         # Mock the OAuth2Credentials creation
-        with patch("gcphcp.auth.google_auth.OAuth2Credentials") as mock_creds:
+        with patch("google.oauth2.credentials.Credentials") as mock_creds:
             mock_instance = Mock()
             mock_creds.return_value = mock_instance
 
@@ -108,7 +108,7 @@ class TestGoogleCloudAuth:
         result = auth_manager._load_stored_credentials()
         assert result is False
 
-    @patch("gcphcp.auth.google_auth.default")
+    @patch("google.auth.default")
     def test_perform_oauth_flow_with_default_credentials(
         self, mock_default, auth_manager
     ):
@@ -121,7 +121,7 @@ class TestGoogleCloudAuth:
         assert auth_manager._credentials == mock_credentials
         mock_default.assert_called_once_with(scopes=REQUIRED_SCOPES)
 
-    @patch("gcphcp.auth.google_auth.InstalledAppFlow")
+    @patch("google_auth_oauthlib.flow.InstalledAppFlow")
     def test_perform_oauth_flow_with_client_secrets(
         self, mock_flow_class, auth_manager, temp_secrets_path
     ):
@@ -142,7 +142,7 @@ class TestGoogleCloudAuth:
         )
         mock_flow.run_local_server.assert_called_once()
 
-    @patch("gcphcp.auth.google_auth.default")
+    @patch("google.auth.default")
     def test_perform_oauth_flow_no_credentials_available(
         self, mock_default, auth_manager
     ):
@@ -239,6 +239,10 @@ class TestGoogleCloudAuth:
 
         assert saved_data["token"] == valid_credentials_data["token"]
         assert saved_data["user_email"] == valid_credentials_data["user_email"]
+        assert auth_manager.credentials_path.stat().st_mode & 0o777 == 0o600
+        assert list(auth_manager.credentials_path.parent.iterdir()) == [
+            auth_manager.credentials_path
+        ]
 
     def test_get_auth_headers_success(self, auth_manager):
         """Test getting authentication headers successfully."""
@@ -306,7 +310,7 @@ class TestGoogleCloudAuth:
             result = auth_manager.is_authenticated()
             assert result is True
 
-    @patch("gcphcp.auth.google_auth.default")
+    @patch("google.auth.default")
     def test_authenticate_success(self, mock_default, auth_manager):
         """Test successful authentication."""
         mock_credentials = Mock()
@@ -324,8 +328,9 @@ class TestGoogleCloudAuth:
                 with patch.object(
                     auth_manager, "_extract_user_email", return_value="test@example.com"
                 ):
-                    mock_oauth.return_value = None
-                    auth_manager._credentials = mock_credentials
+                    mock_oauth.side_effect = lambda: setattr(
+                        auth_manager, "_credentials", mock_credentials
+                    )
 
                     token, email = auth_manager.authenticate()
 
@@ -360,3 +365,484 @@ class TestGoogleCloudAuth:
 
         mock_oauth.assert_called_once()
         assert token == "new_token"
+
+    @staticmethod
+    def _make_id_token(claims):
+        """Build an unsigned JWT carrying the given claims."""
+        import base64
+
+        encoded = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+        return f"header.{encoded.rstrip('=')}.signature"
+
+    @pytest.fixture
+    def no_adc(self):
+        """Make application default credentials and gcloud config unavailable."""
+        from google.auth.exceptions import DefaultCredentialsError
+
+        with patch(
+            "google.auth.default",
+            side_effect=DefaultCredentialsError("No ADC"),
+        ), patch("gcphcp.auth.google_auth._read_gcloud_account", return_value=None):
+            yield
+
+    @staticmethod
+    def _config_helper_result(id_token, account="user@example.com"):
+        """Build a mocked ``gcloud config config-helper`` process result."""
+        output = {
+            "configuration": {"properties": {"core": {"account": account}}},
+            "credential": {"access_token": "access_token", "id_token": id_token},
+        }
+        return Mock(returncode=0, stdout=json.dumps(output).encode(), stderr=b"")
+
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    def test_identity_token_cached_until_expiry(self, mock_run, auth_manager, no_adc):
+        """Test gcloud is not re-invoked while the cached token is fresh."""
+        import time
+
+        id_token = self._make_id_token({"exp": time.time() + 3600})
+        mock_run.return_value = self._config_helper_result(id_token)
+
+        first = auth_manager._get_identity_token_without_audience()
+        second = auth_manager._get_identity_token_without_audience()
+
+        assert first == (id_token, "user@example.com")
+        assert second == first
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][:3] == ["gcloud", "config", "config-helper"]
+
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    def test_identity_token_refetched_near_expiry(self, mock_run, auth_manager, no_adc):
+        """Test tokens close to expiry are refetched from gcloud."""
+        import time
+
+        stale_token = self._make_id_token({"exp": time.time() + 60})
+        fresh_token = self._make_id_token({"exp": time.time() + 3600})
+        mock_run.side_effect = [
+            self._config_helper_result(stale_token),
+            self._config_helper_result(fresh_token),
+        ]
+
+        auth_manager._get_identity_token_without_audience()
+        token, email = auth_manager._get_identity_token_without_audience()
+
+        assert token == fresh_token
+        assert email == "user@example.com"
+        assert mock_run.call_count == 2
+
+    @patch("gcphcp.auth.google_auth._adc_source_available", return_value=True)
+    @patch("gcphcp.auth.google_auth._read_gcloud_account")
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    @patch("google.auth.default")
+    def test_identity_token_from_adc(
+        self, mock_default, mock_run, mock_read_account, _, auth_manager
+    ):
+        """Test identity token is taken from ADC without invoking gcloud."""
+        import time
+
+        id_token = self._make_id_token({"exp": time.time() + 3600})
+        mock_credentials = Mock()
+        mock_credentials.expired = False
+        mock_credentials.token = "access_token"
+        mock_credentials.id_token = id_token
+        mock_default.return_value = (mock_credentials, "test-project")
+        mock_read_account.return_value = "user@example.com"
+
+        token, email = auth_manager._get_identity_token_without_audience()
+
+        assert token == id_token
+        assert email == "user@example.com"
+        mock_credentials.refresh.assert_not_called()
+        mock_run.assert_not_called()
+
+    @patch("gcphcp.auth.google_auth._adc_source_available", return_value=True)
+    @patch("gcphcp.auth.google_auth._read_gcloud_account")
+    @patch("google.auth.default")
+    def test_identity_token_from_adc_uses_token_email(
+        self, mock_default, mock_read_account, _, auth_manager
+    ):
+        """Test the ADC principal's email is used over the gcloud account."""
+        import time
+
+        id_token = self._make_id_token(
+            {"exp": time.time() + 3600, "email": "adc@example.com"}
+        )
+        mock_credentials = Mock()
+        mock_credentials.expired = False
+        mock_credentials.token = "access_token"
+        mock_credentials.id_token = id_token
+        mock_default.return_value = (mock_credentials, "test-project")
+        mock_read_account.return_value = "gcloud@example.com"
+
+        token, email = auth_manager._get_identity_token_without_audience()
+
+        assert token == id_token
+        assert email == "adc@example.com"
+
+    @patch("gcphcp.auth.google_auth._adc_source_available", return_value=False)
+    @patch("google.auth.default")
+    def test_adc_skipped_without_source(self, mock_default, _, auth_manager):
+        """Test ADC is not looked up when no source for it exists."""
+        with pytest.raises(AuthenticationError):
+            auth_manager._get_adc_credentials()
+
+        mock_default.assert_not_called()
+
+    @patch("gcphcp.auth.google_auth._adc_source_available", return_value=True)
+    @patch("google.auth.default")
+    def test_adc_failure_remembered(self, mock_default, _, auth_manager):
+        """Test a failed ADC lookup is not retried by the same instance."""
+        from google.auth.exceptions import DefaultCredentialsError
+
+        mock_default.side_effect = DefaultCredentialsError("No ADC")
+
+        for _attempt in range(2):
+            with pytest.raises(AuthenticationError):
+                auth_manager._get_adc_credentials()
+
+        mock_default.assert_called_once()
+
+    @patch("gcphcp.auth.google_auth._adc_source_available", return_value=True)
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    @patch("google.auth.default")
+    def test_adc_transport_error_falls_back_to_gcloud(
+        self, mock_default, mock_run, _, auth_manager
+    ):
+        """Test a network failure with ADC falls back to gcloud."""
+        import time
+
+        from google.auth.exceptions import TransportError
+
+        mock_credentials = Mock()
+        mock_credentials.expired = True
+        mock_credentials.refresh.side_effect = TransportError("net down")
+        mock_default.return_value = (mock_credentials, "test-project")
+        id_token = self._make_id_token({"exp": time.time() + 3600})
+        mock_run.return_value = self._config_helper_result(id_token)
+
+        token, email = auth_manager.authenticate()
+
+        assert token == id_token
+        assert email == "user@example.com"
+        mock_run.assert_called_once()
+
+    def test_adc_source_available(self, tmp_path, monkeypatch):
+        """Test ADC sources are detected from the environment and config."""
+        from gcphcp.auth import google_auth
+
+        for var in (
+            "GOOGLE_APPLICATION_CREDENTIALS",
+            "GCE_METADATA_HOST",
+            "GCE_METADATA_IP",
+        ):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("CLOUDSDK_CONFIG", str(tmp_path))
+
+        with patch.object(google_auth.Path, "read_text", side_effect=OSError):
+            assert google_auth._adc_source_available() is False
+
+            (tmp_path / "application_default_credentials.json").write_text("{}")
+            assert google_auth._adc_source_available() is True
+
+    def test_read_gcloud_account(self, tmp_path, monkeypatch):
+        """Test reading the active account from gcloud configuration files."""
+        from gcphcp.auth.google_auth import _read_gcloud_account
+
+        monkeypatch.setenv("CLOUDSDK_CONFIG", str(tmp_path))
+        monkeypatch.delenv("CLOUDSDK_CORE_ACCOUNT", raising=False)
+        monkeypatch.delenv("CLOUDSDK_ACTIVE_CONFIG_NAME", raising=False)
+        assert _read_gcloud_account() is None
+
+        (tmp_path / "active_config").write_text("work\n")
+        (tmp_path / "configurations").mkdir()
+        (tmp_path / "configurations" / "config_work").write_text(
+            "[core]\naccount = work@example.com\n"
+        )
+        assert _read_gcloud_account() == "work@example.com"
+
+    def test_concurrent_refreshes_are_coalesced(self, auth_manager):
+        """Test concurrent callers share a single in-flight refresh."""
+        import threading
+
+        started = threading.Event()
+        release = threading.Event()
+        joined = threading.Semaphore(0)
+        calls = []
+
+        class InflightDict(dict):
+            """Signal each caller that finds a refresh already in flight."""
+
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                if value is not None:
+                    joined.release()
+                return value
+
+        auth_manager._refresh_inflight = InflightDict()
+
+        def slow_refresh():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return ("token", "user@example.com")
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    auth_manager._run_single_flight("identity_token", slow_refresh)
+                )
+            )
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(timeout=5)
+        for thread in threads[1:]:
+            thread.start()
+        for _ in threads[1:]:
+            assert joined.acquire(timeout=5)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == [("token", "user@example.com")] * 5
+        assert auth_manager._refresh_inflight == {}
+
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    def test_fetch_identity_token_rechecks_cache(self, mock_run, auth_manager, no_adc):
+        """Test a flight started on a stale read reuses a token cached meanwhile."""
+        import time
+
+        auth_manager._cached_id_token = "fresh_token"
+        auth_manager._cached_id_token_exp = time.time() + 3600
+        auth_manager._cached_user_email = "user@example.com"
+
+        result = auth_manager._run_single_flight(
+            "identity_token", auth_manager._fetch_identity_token
+        )
+
+        assert result == ("fresh_token", "user@example.com")
+        mock_run.assert_not_called()
+
+    def test_should_refresh_near_expiry(self, auth_manager):
+        """Test credentials are refreshed shortly before they expire."""
+        from datetime import datetime, timedelta, timezone
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        mock_credentials = Mock()
+        mock_credentials.expired = False
+        auth_manager._credentials = mock_credentials
+
+        mock_credentials.expiry = now + timedelta(minutes=2)
+        assert auth_manager._should_refresh() is True
+
+        mock_credentials.expiry = now + timedelta(minutes=8)
+        assert auth_manager._should_refresh() is False
+        assert auth_manager._should_refresh_in_background() is True
+
+        mock_credentials.expiry = now + timedelta(minutes=30)
+        assert auth_manager._should_refresh() is False
+        assert auth_manager._should_refresh_in_background() is False
+
+    def test_stored_credentials_keep_expiry(self, auth_manager, temp_credentials_path):
+        """Test expiry survives a save and load, so refreshes can be scheduled."""
+        from datetime import datetime, timedelta, timezone
+
+        from google.oauth2.credentials import Credentials as OAuth2Credentials
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        expiry = now + timedelta(minutes=2)
+        auth_manager._credentials = OAuth2Credentials(
+            token="access_token",
+            refresh_token="refresh_token",
+            id_token=self._make_id_token({"email": "user@example.com"}),
+            expiry=expiry,
+        )
+        auth_manager._save_credentials()
+
+        reloaded = GoogleCloudAuth(credentials_path=temp_credentials_path)
+        assert reloaded._load_stored_credentials() is True
+
+        assert reloaded._credentials.expiry == expiry
+        assert reloaded._should_refresh() is True
+
+    def test_authenticate_keeps_loaded_credentials(self, auth_manager):
+        """Test authenticate does not replace credentials already in memory."""
+        mock_credentials = Mock()
+        mock_credentials.expiry = None
+        mock_credentials.expired = False
+        mock_credentials.id_token = "in_memory_token"
+        auth_manager._credentials = mock_credentials
+        auth_manager._user_email = "user@example.com"
+
+        with patch.object(
+            auth_manager,
+            "_get_identity_token_without_audience",
+            side_effect=AuthenticationError("No gcloud token"),
+        ), patch.object(auth_manager, "_load_stored_credentials") as mock_load:
+            token, email = auth_manager.authenticate()
+
+        assert token == "in_memory_token"
+        mock_load.assert_not_called()
+
+    def test_extract_user_email_decodes_each_token_once(self, auth_manager):
+        """Test the email is decoded once per ID token."""
+        from gcphcp.auth import google_auth
+
+        mock_credentials = Mock()
+        mock_credentials.id_token = self._make_id_token({"email": "a@example.com"})
+        auth_manager._credentials = mock_credentials
+
+        with patch.object(
+            google_auth,
+            "_decode_jwt_payload",
+            wraps=google_auth._decode_jwt_payload,
+        ) as mock_decode:
+            assert auth_manager._extract_user_email() == "a@example.com"
+            auth_manager._user_email = None
+            assert auth_manager._extract_user_email() == "a@example.com"
+
+        mock_decode.assert_called_once()
+
+    def test_is_authenticated_cached(self, auth_manager):
+        """Test is_authenticated reuses its result until invalidated."""
+        mock_credentials = Mock()
+        mock_credentials.expired = False
+        mock_credentials.expiry = None
+        mock_credentials.token = "valid_token"
+        auth_manager._credentials = mock_credentials
+
+        with patch.object(
+            auth_manager, "_should_refresh", return_value=False
+        ) as mock_should_refresh:
+            assert auth_manager.is_authenticated() is True
+            assert auth_manager.is_authenticated() is True
+            assert mock_should_refresh.call_count == 1
+
+            auth_manager.logout()
+            assert auth_manager._is_auth_cache is None
+
+    def test_invalidate_cached_token_refreshes_oauth_credentials(self, auth_manager):
+        """Test invalidating with stored OAuth credentials issues a new token."""
+        mock_credentials = Mock()
+        mock_credentials.refresh_token = "refresh_token"
+        mock_credentials.id_token = "rejected_token"
+        mock_credentials.refresh.side_effect = lambda request: setattr(
+            mock_credentials, "id_token", "new_token"
+        )
+        auth_manager._credentials = mock_credentials
+
+        with patch.object(auth_manager, "_save_credentials"):
+            assert auth_manager.invalidate_cached_token() is True
+
+        mock_credentials.refresh.assert_called_once()
+        assert auth_manager._credentials.id_token == "new_token"
+
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    def test_invalidate_cached_token_forces_gcloud_refresh(
+        self, mock_run, auth_manager, no_adc
+    ):
+        """Test invalidating a gcloud token forces gcloud to issue a new one."""
+        import time
+
+        rejected_token = self._make_id_token({"exp": time.time() + 3600, "n": 1})
+        new_token = self._make_id_token({"exp": time.time() + 3600, "n": 2})
+        mock_run.side_effect = [
+            self._config_helper_result(rejected_token),
+            self._config_helper_result(new_token),
+        ]
+
+        assert auth_manager._get_identity_token_without_audience()[0] == (
+            rejected_token
+        )
+        assert auth_manager.invalidate_cached_token() is True
+
+        assert "--force-auth-refresh" in mock_run.call_args_list[1][0][0]
+        assert auth_manager._get_identity_token_without_audience()[0] == new_token
+        assert mock_run.call_count == 2
+
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    def test_invalidate_cached_token_same_gcloud_token(
+        self, mock_run, auth_manager, no_adc
+    ):
+        """Test invalidating reports False when gcloud returns the same token."""
+        import time
+
+        id_token = self._make_id_token({"exp": time.time() + 3600})
+        mock_run.return_value = self._config_helper_result(id_token)
+
+        auth_manager._get_identity_token_without_audience()
+
+        assert auth_manager.invalidate_cached_token() is False
+
+    def test_invalidate_cached_token_without_refreshable_token(self, auth_manager):
+        """Test invalidating reports False when no new token can be obtained."""
+        assert auth_manager.invalidate_cached_token() is False
+
+        mock_credentials = Mock()
+        mock_credentials.refresh_token = None
+        auth_manager._credentials = mock_credentials
+
+        assert auth_manager.invalidate_cached_token() is False
+        mock_credentials.refresh.assert_not_called()
+
+    def test_invalidate_cached_token_refresh_failure(self, auth_manager):
+        """Test a failed refresh reports that nothing was invalidated."""
+        from google.auth.exceptions import RefreshError
+
+        mock_credentials = Mock()
+        mock_credentials.refresh_token = "refresh_token"
+        mock_credentials.refresh.side_effect = RefreshError("invalid_grant")
+        auth_manager._credentials = mock_credentials
+
+        assert auth_manager.invalidate_cached_token() is False
+
+    @patch("gcphcp.auth.google_auth.subprocess.run")
+    def test_run_gcloud_not_logged_in(self, mock_run, auth_manager):
+        """Test gcloud failures are reported from the decoded stderr."""
+        mock_run.return_value = Mock(
+            returncode=1,
+            stdout=b"",
+            stderr=b"ERROR: You do not currently have an active account selected.",
+        )
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            auth_manager._run_gcloud(["config", "config-helper"])
+        assert "gcloud auth login" in str(exc_info.value)
+
+    def test_logout_without_stored_credentials(self, auth_manager):
+        """Test logout succeeds when no credentials file exists."""
+        auth_manager._user_email = "test@example.com"
+
+        auth_manager.logout()
+
+        assert not auth_manager.credentials_path.exists()
+        assert auth_manager._user_email is None
+
+    def test_background_refresh_swallows_transport_errors(self, auth_manager):
+        """Test network failures in the background refresh are only logged."""
+        from google.auth.exceptions import TransportError
+
+        mock_credentials = Mock()
+        mock_credentials.refresh.side_effect = TransportError("Network down")
+        auth_manager._credentials = mock_credentials
+
+        with patch("gcphcp.auth.google_auth.threading.Thread") as mock_thread:
+            auth_manager._start_background_refresh()
+
+        # Run the thread target inline; an escaping error would fail the test
+        mock_thread.call_args[1]["target"]()
+        mock_credentials.refresh.assert_called_once()
+
+    def test_background_refresh_does_not_save(self, auth_manager):
+        """Test the background refresh leaves the credentials file alone."""
+        auth_manager._credentials = Mock()
+
+        with patch("gcphcp.auth.google_auth.threading.Thread") as mock_thread:
+            auth_manager._start_background_refresh()
+
+        with patch.object(auth_manager, "_save_credentials") as mock_save:
+            mock_thread.call_args[1]["target"]()
+
+        auth_manager._credentials.refresh.assert_called_once()
+        mock_save.assert_not_called()
@@ -0,0 +1,49 @@
+"""Unit tests for cluster models."""
+
+import json
+
+from gcphcp.models.cluster import Cluster
+
+
+class TestCluster:
+    """Test suite for Cluster model."""
+
+    def test_json_serializes_timestamps_as_iso(self):
+        """Test JSON output renders timestamps with a +00:00 offset."""
+        cluster = Cluster.from_api_response(
+            {
+                "id": "cluster-12345678",
+                "name": "demo",
+                "createdAt": "2024-01-01T00:00:00Z",
+                "updatedAt": "2024-01-02T12:30:00Z",
+            }
+        )
+
+        dumped = cluster.model_dump(mode="json")
+        assert dumped["createdAt"] == "2024-01-01T00:00:00+00:00"
+        assert dumped["updatedAt"] == "2024-01-02T12:30:00+00:00"
+
+        dumped_json = json.loads(cluster.model_dump_json())
+        assert dumped_json["createdAt"] == "2024-01-01T00:00:00+00:00"
+        assert dumped_json["updatedAt"] == "2024-01-02T12:30:00+00:00"
+
+    def test_json_serializes_missing_timestamps_as_none(self):
+        """Test unset timestamps serialize to None."""
+        cluster = Cluster(id="cluster-12345678", name="demo")
+
+        dumped = cluster.model_dump(mode="json")
+        assert dumped["createdAt"] is None
+        assert dumped["updatedAt"] is None
+        assert json.loads(cluster.model_dump_json())["createdAt"] is None
+
+    def test_python_dump_keeps_datetimes(self):
+        """Test the serializer only applies in JSON mode."""
+        cluster = Cluster.from_api_response(
+            {
+                "id": "cluster-12345678",
+                "name": "demo",
+                "createdAt": "2024-01-01T00:00:00Z",
+            }
+        )
+
+        assert cluster.model_dump()["createdAt"] == cluster.createdAt
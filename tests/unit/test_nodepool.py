@@ -0,0 +1,133 @@
+"""Unit tests for nodepool models."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from gcphcp.models.nodepool import NodePool, NodePoolManagement
+
+
+class TestNodePool:
+    """Test suite for NodePool model."""
+
+    @pytest.fixture
+    def nodepool_data(self):
+        """Provide nodepool API response data."""
+        return {
+            "id": "np-12345678",
+            "name": "workers",
+            "clusterId": "cluster-12345678",
+            "createdBy": "user@example.com",
+            "generation": 2,
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-02T00:00:00Z",
+            "unknownField": "ignored",
+            "spec": {
+                "clusterId": "cluster-12345678",
+                "machineType": "n1-standard-4",
+                "nodeCount": 3,
+                "management": {"autoRepair": True, "autoUpgrade": False},
+            },
+            "status": {
+                "phase": "Ready",
+                "nodeCount": 3,
+                "readyNodeCount": 2,
+                "conditions": [
+                    {
+                        "type": "Ready",
+                        "status": "True",
+                        "lastTransitionTime": "2024-01-01T00:05:00Z",
+                    }
+                ],
+            },
+        }
+
+    def test_from_api_response(self, nodepool_data):
+        """Test creating a nodepool from API response data."""
+        nodepool = NodePool.from_api_response(nodepool_data)
+
+        assert nodepool.id == "np-12345678"
+        assert nodepool.createdAt == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert nodepool.spec is not None
+        assert nodepool.spec.management == NodePoolManagement(
+            autoRepair=True, autoUpgrade=False
+        )
+        assert nodepool.status is not None
+        condition = nodepool.status.conditions[0]
+        assert condition.lastTransitionTime == datetime(
+            2024, 1, 1, 0, 5, tzinfo=timezone.utc
+        )
+        assert nodepool.is_ready()
+        assert nodepool.get_node_info() == "2/3 ready"
+
+    def test_from_api_response_does_not_mutate_input(self, nodepool_data):
+        """Test the API response data is left untouched."""
+        NodePool.from_api_response(nodepool_data)
+
+        assert nodepool_data["createdAt"] == "2024-01-01T00:00:00Z"
+        assert isinstance(nodepool_data["status"], dict)
+
+    def test_from_api_response_minimal(self):
+        """Test creating a nodepool with only required fields."""
+        nodepool = NodePool.from_api_response(
+            {"id": "np-1", "name": "workers", "clusterId": "cluster-1"}
+        )
+
+        assert nodepool.get_display_status() == "Unknown"
+        assert nodepool.get_node_info() == "Unknown"
+        assert nodepool.get_age() == "Unknown"
+
+    def test_from_api_response_list(self, nodepool_data):
+        """Test creating several nodepools in one pass."""
+        second = dict(nodepool_data, id="np-87654321", status=None)
+
+        nodepools = NodePool.from_api_response_list([nodepool_data, second])
+
+        assert [nodepool.id for nodepool in nodepools] == [
+            "np-12345678",
+            "np-87654321",
+        ]
+        assert nodepools[0] == NodePool.from_api_response(nodepool_data)
+        assert nodepools[1].status is None
+        assert NodePool.from_api_response_list([]) == []
+
+    @pytest.mark.parametrize("tz", [timezone.utc, None], ids=["aware", "naive"])
+    @pytest.mark.parametrize(
+        "delta, expected",
+        [
+            (timedelta(days=2, hours=3), "2d"),
+            (timedelta(hours=5, minutes=10), "5h"),
+            (timedelta(minutes=30), "30m"),
+            (timedelta(seconds=45), "45s"),
+        ],
+    )
+    def test_get_age(self, delta, expected, tz):
+        """Test nodepool age formatting for aware and naive timestamps."""
+        nodepool = NodePool(
+            id="np-1",
+            name="workers",
+            clusterId="cluster-1",
+            createdAt=datetime.now(tz) - delta,
+        )
+
+        assert nodepool.get_age() == expected
+        assert NodePool.render_ages([nodepool]) == [expected]
+
+    def test_render_ages_unknown(self):
+        """Test nodepools without creation time render as unknown."""
+        nodepool = NodePool(id="np-1", name="workers", clusterId="cluster-1")
+
+        assert NodePool.render_ages([nodepool]) == ["Unknown"]
+
+    def test_dump_list_round_trip(self, nodepool_data):
+        """Test serialized nodepools can be parsed back unchanged."""
+        import json
+
+        nodepools = NodePool.from_api_response_list([nodepool_data])
+
+        dumped = NodePool.dump_list(nodepools)
+
+        assert dumped[0]["createdAt"] == "2024-01-01T00:00:00+00:00"
+        assert "unknownField" not in dumped[0]
+        json.dumps(dumped)
+        assert NodePool.from_api_response_list(dumped) == nodepools